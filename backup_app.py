@@ -2,14 +2,16 @@
 
 import tkinter as tk
 from tkinter import ttk, messagebox
+import queue
+import sys
 import threading
-import time
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from datetime import datetime
 from typing import Optional
 
 from drive_detector import DriveDetector, DriveInfo
-from settings import Settings, SETTINGS_FILENAME
+from settings import Settings, SETTINGS_FILENAME, LEGACY_SETTINGS_FILENAME
 from backup_engine import BackupEngine, BackupProgress
 
 
@@ -23,6 +25,15 @@ class BackupApp:
     STATE_PREPARING = "preparing"
     STATE_BACKING_UP = "backing_up"
 
+    # Drive poll intervals (ms): fast while waiting for a drive, relaxed
+    # once one is confirmed, backing off up to the cap while nothing changes
+    POLL_NO_DRIVE_MS = 1500
+    POLL_READY_MS = 6000
+    POLL_MAX_MS = 30000
+
+    # How often the main thread drains results from the scan worker (ms)
+    DRIVE_QUEUE_DRAIN_MS = 200
+
     def __init__(self, test_mode: bool = False):
         self.test_mode = test_mode
 
@@ -34,8 +45,9 @@ class BackupApp:
         self.root.geometry("500x400")
         self.root.resizable(False, False)
 
-        # Center the window
-        self.root.update_idletasks()
+        # Center the window. The screen dimensions are available without
+        # forcing an idle pass, so no update_idletasks() (which blocks on
+        # first paint) is needed.
         x = (self.root.winfo_screenwidth() - 500) // 2
         y = (self.root.winfo_screenheight() - 400) // 2
         self.root.geometry(f"500x400+{x}+{y}")
@@ -47,6 +59,18 @@ class BackupApp:
         self.backup_engine: Optional[BackupEngine] = None
         self.state = self.STATE_NO_DRIVE
         self._test_settings_data = {}  # In-memory settings for test mode
+        self._pending_update = False  # True while a progress update is queued
+        self._last_progress_text = ""
+        self._last_file_text = ""
+        self._last_pct_int = -1
+        self._poll_interval_ms = self.POLL_NO_DRIVE_MS
+        self._drive_queue: queue.Queue = queue.Queue()
+        self._scan_wakeup = threading.Event()  # Set to force an immediate rescan
+
+        # One persistent worker for the prepare/backup phases; reusing it
+        # avoids spawning a fresh thread per click and serializes the two
+        # phases on a single thread
+        self._bg = ThreadPoolExecutor(max_workers=1, thread_name_prefix="backup")
 
         # Configure styles
         self._configure_styles()
@@ -55,6 +79,9 @@ class BackupApp:
         self.main_frame = ttk.Frame(self.root, padding=20)
         self.main_frame.pack(fill=tk.BOTH, expand=True)
 
+        # Build every screen once; state changes just swap frames
+        self._build_screens()
+
         # Start in "no drive" state
         self._show_no_drive()
 
@@ -63,7 +90,23 @@ class BackupApp:
             # In test mode, show "no drive" for 2 seconds, then simulate detection
             self.root.after(2000, self._test_simulate_drive_detected)
         else:
-            self._poll_for_drives()
+            # Defer detection startup until the main loop is running so
+            # the window paints first
+            self.root.after(100, self._start_drive_detection)
+
+    def _start_drive_detection(self):
+        """Start the drive scan worker and hotplug notifications."""
+        # Drive enumeration can block for hundreds of ms on Windows, so
+        # it runs on a worker thread; the main loop only drains its
+        # result queue.
+        scanner = threading.Thread(target=self._drive_scan_worker, daemon=True)
+        scanner.start()
+        self.root.after(self.DRIVE_QUEUE_DRAIN_MS, self._drain_drive_queue)
+
+        # On Windows, let drive hotplug wake the scanner immediately
+        # instead of waiting out the poll interval
+        if sys.platform == "win32":
+            self._register_device_notifications()
 
     def _configure_styles(self):
         """Configure ttk styles for the app."""
@@ -91,11 +134,6 @@ class BackupApp:
         if self.test_mode:
             style.configure("Test.TLabel", font=("Segoe UI", 9), foreground="purple")
 
-    def _clear_main_frame(self):
-        """Remove all widgets from the main frame."""
-        for widget in self.main_frame.winfo_children():
-            widget.destroy()
-
     def _add_test_mode_indicator(self, container):
         """Add a test mode indicator to the UI."""
         if self.test_mode:
@@ -106,17 +144,45 @@ class BackupApp:
             )
             test_label.pack(pady=(20, 0))
 
-    def _show_no_drive(self):
-        """Show the 'please plug in drive' screen."""
-        self.state = self.STATE_NO_DRIVE
-        self._clear_main_frame()
+    def _build_screens(self):
+        """
+        Build all five screens up front as hidden frames. State changes
+        just reconfigure the dynamic labels and swap which frame is
+        placed, instead of destroying and recreating every widget (and
+        re-doing font lookups) on each transition.
+        """
+        self._screens = {}
+        self._visible_screen = None
+
+        self._build_no_drive_screen()
+        self._build_confirm_drive_screen()
+        self._build_ready_screen()
+        self._build_preparing_screen()
+        self._build_backing_up_screen()
+
+    def _switch_screen(self, name: str):
+        """Make the named screen the visible one."""
+        previous = self._visible_screen
+        if previous == name:
+            return
+
+        if previous == "preparing":
+            # Don't leave the indeterminate bar animating off-screen
+            self.prep_progress_bar.stop()
 
-        # Center content
+        if previous is not None:
+            self._screens[previous].place_forget()
+
+        self._screens[name].place(relx=0.5, rely=0.5, anchor=tk.CENTER)
+        self._visible_screen = name
+
+    def _build_no_drive_screen(self):
+        """Build the 'please plug in drive' screen."""
         container = ttk.Frame(self.main_frame)
-        container.place(relx=0.5, rely=0.5, anchor=tk.CENTER)
+        self._screens["no_drive"] = container
 
         # Icon/emoji representation
-        icon_label = ttk.Label(container, text="💾", font=("Segoe UI Emoji", 48))
+        icon_label = ttk.Label(container, text="\U0001f4be", font=("Segoe UI Emoji", 48))
         icon_label.pack(pady=(0, 20))
 
         # Title
@@ -137,18 +203,13 @@ class BackupApp:
 
         self._add_test_mode_indicator(container)
 
-    def _show_confirm_drive(self, drive: DriveInfo):
-        """Show the drive confirmation screen."""
-        self.state = self.STATE_CONFIRM_DRIVE
-        self.current_drive = drive
-        self._clear_main_frame()
-
-        # Center content
+    def _build_confirm_drive_screen(self):
+        """Build the drive confirmation screen."""
         container = ttk.Frame(self.main_frame)
-        container.place(relx=0.5, rely=0.5, anchor=tk.CENTER)
+        self._screens["confirm_drive"] = container
 
         # Icon
-        icon_label = ttk.Label(container, text="💿", font=("Segoe UI Emoji", 48))
+        icon_label = ttk.Label(container, text="\U0001f4bf", font=("Segoe UI Emoji", 48))
         icon_label.pack(pady=(0, 20))
 
         # Title
@@ -159,14 +220,14 @@ class BackupApp:
         )
         title.pack()
 
-        # Drive info
-        drive_info = ttk.Label(
+        # Drive info (text set per detected drive)
+        self._confirm_drive_label = ttk.Label(
             container,
-            text=f"{drive.display_name}\n{drive.free_gb:.1f} GB free of {drive.total_gb:.1f} GB",
+            text="",
             style="Subtitle.TLabel",
             justify=tk.CENTER
         )
-        drive_info.pack(pady=(15, 20))
+        self._confirm_drive_label.pack(pady=(15, 20))
 
         # Question
         question = ttk.Label(
@@ -197,70 +258,22 @@ class BackupApp:
 
         self._add_test_mode_indicator(container)
 
-    def _show_ready(self):
-        """Show the main backup screen."""
-        self.state = self.STATE_READY
-        self._clear_main_frame()
-
-        # Center content
+    def _build_ready_screen(self):
+        """Build the main backup screen."""
         container = ttk.Frame(self.main_frame)
-        container.place(relx=0.5, rely=0.5, anchor=tk.CENTER)
-
-        # Status icon and message
-        backed_up_today = False
-        last_backup = None
-
-        if self.test_mode:
-            backed_up_today = self._test_settings_data.get("backed_up_today", False)
-            last_backup = self._test_settings_data.get("last_backup")
-        elif self.settings:
-            backed_up_today = self.settings.was_backed_up_today()
-            last_backup = self.settings.get_last_backup()
-
-        if backed_up_today:
-            icon_label = ttk.Label(container, text="✅", font=("Segoe UI Emoji", 48))
-            icon_label.pack(pady=(0, 20))
-
-            status = ttk.Label(
-                container,
-                text="Backed up successfully today!",
-                style="Success.TLabel"
-            )
-            status.pack()
-        else:
-            icon_label = ttk.Label(container, text="📁", font=("Segoe UI Emoji", 48))
-            icon_label.pack(pady=(0, 20))
+        self._screens["ready"] = container
 
-            if last_backup:
-                days_ago = (datetime.now() - last_backup).days
-                if days_ago == 1:
-                    status_text = "Last backup: Yesterday"
-                elif days_ago < 7:
-                    status_text = f"Last backup: {days_ago} days ago"
-                else:
-                    status_text = f"Last backup: {last_backup.strftime('%B %d, %Y')}"
+        # Status icon and message (set per backup state in _show_ready)
+        self._ready_icon_label = ttk.Label(container, text="\U0001f4c1",
+                                           font=("Segoe UI Emoji", 48))
+        self._ready_icon_label.pack(pady=(0, 20))
 
-                status = ttk.Label(
-                    container,
-                    text=status_text,
-                    style="Warning.TLabel"
-                )
-            else:
-                status = ttk.Label(
-                    container,
-                    text="No backups yet",
-                    style="Status.TLabel"
-                )
-            status.pack()
+        self._ready_status_label = ttk.Label(container, text="", style="Status.TLabel")
+        self._ready_status_label.pack()
 
         # Drive info
-        if self.current_drive:
-            drive_info = ttk.Label(
-                container,
-                text=f"Drive: {self.current_drive.display_name} ({self.current_drive.free_gb:.1f} GB free)",
-                style="Subtitle.TLabel"
-            )
-            drive_info.pack(pady=(15, 25))
+        self._ready_drive_label = ttk.Label(container, text="", style="Subtitle.TLabel")
+        self._ready_drive_label.pack(pady=(15, 25))
 
         # Backup button
         backup_btn = ttk.Button(
@@ -273,17 +286,13 @@ class BackupApp:
 
         self._add_test_mode_indicator(container)
 
-    def _show_preparing(self):
-        """Show the preparing/counting files screen."""
-        self.state = self.STATE_PREPARING
-        self._clear_main_frame()
-
-        # Center content
+    def _build_preparing_screen(self):
+        """Build the preparing/counting files screen."""
         container = ttk.Frame(self.main_frame)
-        container.place(relx=0.5, rely=0.5, anchor=tk.CENTER)
+        self._screens["preparing"] = container
 
         # Icon
-        icon_label = ttk.Label(container, text="🔍", font=("Segoe UI Emoji", 48))
+        icon_label = ttk.Label(container, text="\U0001f50d", font=("Segoe UI Emoji", 48))
         icon_label.pack(pady=(0, 20))
 
         # Title
@@ -301,7 +310,6 @@ class BackupApp:
             mode='indeterminate'
         )
         self.prep_progress_bar.pack(pady=(20, 10))
-        self.prep_progress_bar.start(10)
 
         # Status text
         self.prep_status_label = ttk.Label(
@@ -313,17 +321,13 @@ class BackupApp:
 
         self._add_test_mode_indicator(container)
 
-    def _show_backing_up(self):
-        """Show the backup progress screen."""
-        self.state = self.STATE_BACKING_UP
-        self._clear_main_frame()
-
-        # Center content
+    def _build_backing_up_screen(self):
+        """Build the backup progress screen."""
         container = ttk.Frame(self.main_frame)
-        container.place(relx=0.5, rely=0.5, anchor=tk.CENTER)
+        self._screens["backing_up"] = container
 
         # Icon
-        icon_label = ttk.Label(container, text="⏳", font=("Segoe UI Emoji", 48))
+        icon_label = ttk.Label(container, text="\u23f3", font=("Segoe UI Emoji", 48))
         icon_label.pack(pady=(0, 20))
 
         # Title
@@ -361,39 +365,167 @@ class BackupApp:
 
         self._add_test_mode_indicator(container)
 
-    def _poll_for_drives(self):
-        """Poll for external drives every 2 seconds."""
+    def _show_no_drive(self):
+        """Show the 'please plug in drive' screen."""
+        self.state = self.STATE_NO_DRIVE
+        self._switch_screen("no_drive")
+
+    def _show_confirm_drive(self, drive: DriveInfo):
+        """Show the drive confirmation screen."""
+        self.state = self.STATE_CONFIRM_DRIVE
+        self.current_drive = drive
+
+        self._confirm_drive_label.config(
+            text=f"{drive.display_name}\n{drive.free_gb:.1f} GB free of {drive.total_gb:.1f} GB"
+        )
+        self._switch_screen("confirm_drive")
+
+    def _show_ready(self):
+        """Show the main backup screen."""
+        self.state = self.STATE_READY
+        self._poll_interval_ms = self.POLL_READY_MS
+
+        # Status icon and message
+        backed_up_today = False
+        last_backup = None
+
+        if self.test_mode:
+            backed_up_today = self._test_settings_data.get("backed_up_today", False)
+            last_backup = self._test_settings_data.get("last_backup")
+        elif self.settings:
+            backed_up_today = self.settings.was_backed_up_today()
+            last_backup = self.settings.get_last_backup()
+
+        if backed_up_today:
+            self._ready_icon_label.config(text="\u2705")
+            self._ready_status_label.config(
+                text="Backed up successfully today!",
+                style="Success.TLabel"
+            )
+        else:
+            self._ready_icon_label.config(text="\U0001f4c1")
+
+            if last_backup:
+                days_ago = (datetime.now() - last_backup).days
+                if days_ago == 1:
+                    status_text = "Last backup: Yesterday"
+                elif days_ago < 7:
+                    status_text = f"Last backup: {days_ago} days ago"
+                else:
+                    status_text = f"Last backup: {last_backup.strftime('%B %d, %Y')}"
+
+                self._ready_status_label.config(text=status_text, style="Warning.TLabel")
+            else:
+                self._ready_status_label.config(text="No backups yet", style="Status.TLabel")
+
+        # Drive info
+        if self.current_drive:
+            self._ready_drive_label.config(
+                text=f"Drive: {self.current_drive.display_name} ({self.current_drive.free_gb:.1f} GB free)"
+            )
+        else:
+            self._ready_drive_label.config(text="")
+
+        self._switch_screen("ready")
+
+    def _show_preparing(self):
+        """Show the preparing/counting files screen."""
+        self.state = self.STATE_PREPARING
+        self._switch_screen("preparing")
+        self.prep_progress_bar.start(10)
+
+    def _show_backing_up(self):
+        """Show the backup progress screen."""
+        self.state = self.STATE_BACKING_UP
+        self._pending_update = False
+        self._last_progress_text = ""
+        self._last_file_text = ""
+        self._last_pct_int = -1
+
+        self.progress_bar['value'] = 0
+        self.progress_label.config(text="Counting files...")
+        self.current_file_label.config(text="")
+        self._switch_screen("backing_up")
+
+    def _drive_scan_worker(self):
+        """
+        Enumerate drives on a daemon thread so the blocking WMI/ctypes
+        calls never stall the Tk main loop. Results are posted to
+        _drive_queue; all UI transitions happen on the main thread.
+        """
+        while True:
+            # Sleep out the poll interval, but wake early when a device
+            # change notification fires
+            self._scan_wakeup.wait(self._poll_interval_ms / 1000.0)
+            self._scan_wakeup.clear()
+
+            # Skip scanning during a backup; hotplug doesn't matter then
+            state = self.state
+            if state == self.STATE_NO_DRIVE:
+                # Look for a drive with our settings file first (old
+                # drives may still carry the pre-msgpack JSON name)
+                drive = (self.detector.find_drive_with_settings(SETTINGS_FILENAME)
+                         or self.detector.find_drive_with_settings(LEGACY_SETTINGS_FILENAME))
+                if drive:
+                    self._drive_queue.put(("known_drive", drive))
+                else:
+                    # Check for any external drive
+                    drive = self.detector.get_first_drive()
+                    if drive:
+                        self._drive_queue.put(("new_drive", drive))
+
+            elif state == self.STATE_READY:
+                self._drive_queue.put(("drive_list", self.detector.get_external_drives()))
+
+    def _register_device_notifications(self):
+        """
+        Let drive hotplug wake the scan worker the moment it happens.
+        The periodic poll stays in place as a safety net; registration
+        failures just mean we fall back to polling alone.
+        """
+        self.detector.start_watching(self.root.winfo_id(), self._scan_wakeup.set)
+
+    def _drain_drive_queue(self):
+        """Apply scan results from the worker thread (runs on main thread)."""
+        try:
+            while True:
+                kind, payload = self._drive_queue.get_nowait()
+                self._handle_drive_event(kind, payload)
+        except queue.Empty:
+            pass
+
+        self.root.after(self.DRIVE_QUEUE_DRAIN_MS, self._drain_drive_queue)
+
+    def _handle_drive_event(self, kind: str, payload):
+        """Handle one drive scan result, backing off while nothing changes."""
         if self.state == self.STATE_NO_DRIVE:
-            # Look for a drive with our settings file first
-            drive = self.detector.find_drive_with_settings(SETTINGS_FILENAME)
+            self._poll_interval_ms = self.POLL_NO_DRIVE_MS
 
-            if drive:
+            if kind == "known_drive":
                 # Found our backup drive
-                self.current_drive = drive
-                self.settings = Settings(drive.path)
+                self.current_drive = payload
+                self.settings = Settings(payload.path)
                 self.settings.load()
                 self._show_ready()
-            else:
-                # Check for any external drive
-                drive = self.detector.get_first_drive()
-                if drive:
-                    self._show_confirm_drive(drive)
+            elif kind == "new_drive":
+                self._show_confirm_drive(payload)
 
-        elif self.state == self.STATE_READY:
+        elif self.state == self.STATE_READY and kind == "drive_list":
             # Check if drive is still connected
-            drives = self.detector.get_external_drives()
             if self.current_drive:
                 still_connected = any(
                     d.letter == self.current_drive.letter
-                    for d in drives
+                    for d in payload
                 )
                 if not still_connected:
                     self.current_drive = None
                     self.settings = None
+                    self._poll_interval_ms = self.POLL_NO_DRIVE_MS
                     self._show_no_drive()
-
-        # Schedule next poll
-        self.root.after(2000, self._poll_for_drives)
+                else:
+                    # Nothing changed: exponential backoff up to the cap
+                    self._poll_interval_ms = min(self._poll_interval_ms * 2,
+                                                 self.POLL_MAX_MS)
 
     def _test_simulate_drive_detected(self):
         """Simulate a drive being detected in test mode."""
@@ -436,12 +568,15 @@ class BackupApp:
 
         self._show_preparing()
 
-        # Run preparation in background thread
         if self.test_mode:
-            thread = threading.Thread(target=self._run_test_backup, daemon=True)
-        else:
-            thread = threading.Thread(target=self._prepare_backup, daemon=True)
-        thread.start()
+            # Simulated backup: a chain of after() callbacks on the main
+            # thread replaces the old sleep loop on a worker thread (which
+            # also touched Tk from the wrong thread)
+            self.root.after(1000, self._start_test_backup)
+            return
+
+        # Run preparation on the background worker
+        self._bg.submit(self._prepare_backup)
 
     def _prepare_backup(self):
         """Prepare backup by counting files and checking disk space."""
@@ -494,14 +629,19 @@ class BackupApp:
         self._prepared_total_files = total_files
         self._prepared_total_bytes = total_bytes
 
-        thread = threading.Thread(target=self._run_backup, daemon=True)
-        thread.start()
+        self._bg.submit(self._run_backup)
 
     def _run_backup(self):
         """Run the backup process (called in background thread)."""
         def progress_callback(progress: BackupProgress):
-            # Update UI from main thread
-            self.root.after(0, lambda: self._update_progress(progress))
+            # Update UI from main thread; skip scheduling if an update is
+            # already queued so stale events don't pile up in the Tk queue.
+            # Snapshot here: the engine keeps mutating the live instance.
+            if self._pending_update:
+                return
+            self._pending_update = True
+            snapshot = progress.snapshot()
+            self.root.after(0, lambda: self._update_progress(snapshot))
 
         # Use pre-counted values from preparation phase
         result = self.backup_engine.run_with_counts(
@@ -513,94 +653,86 @@ class BackupApp:
         # Backup complete
         self.root.after(0, lambda: self._on_backup_complete(result))
 
-    def _run_test_backup(self):
-        """Run a simulated backup in test mode."""
-        # Simulate file names for realistic progress display
-        test_files = [
-            "Documents\\report.docx",
-            "Documents\\budget.xlsx",
-            "Pictures\\vacation\\IMG_001.jpg",
-            "Pictures\\vacation\\IMG_002.jpg",
-            "Pictures\\family\\photo1.png",
-            "Desktop\\notes.txt",
-            "Videos\\birthday.mp4",
-            "Documents\\recipes\\cookies.pdf",
-            "Pictures\\screenshots\\screen1.png",
-            "Documents\\taxes\\2024.pdf",
-        ]
-
-        total_files = 1247  # Simulated total
-        total_bytes = 15_800_000_000  # ~15.8 GB simulated
-
-        # Simulate counting phase
-        progress = BackupProgress(
-            total_files=0,
-            copied_files=0,
-            total_bytes=0,
-            copied_bytes=0,
-            current_file="Counting files...",
-            errors=[]
-        )
-        self.root.after(0, lambda: self._update_progress(progress))
-        time.sleep(1)
-
-        # Update with totals
-        progress.total_files = total_files
-        progress.total_bytes = total_bytes
-        self.root.after(0, lambda p=progress: self._update_progress(p))
-        time.sleep(0.5)
-
-        # Simulate copying with progress
-        for i in range(100):
-            progress.copied_files = int((i / 100) * total_files)
-            progress.copied_bytes = int((i / 100) * total_bytes)
-            progress.current_file = test_files[i % len(test_files)]
-
-            self.root.after(0, lambda p=BackupProgress(
-                total_files=progress.total_files,
-                copied_files=progress.copied_files,
-                total_bytes=progress.total_bytes,
-                copied_bytes=progress.copied_bytes,
-                current_file=progress.current_file,
+    # Simulated file names and totals for test-mode progress display
+    TEST_FILES = [
+        "Documents\\report.docx",
+        "Documents\\budget.xlsx",
+        "Pictures\\vacation\\IMG_001.jpg",
+        "Pictures\\vacation\\IMG_002.jpg",
+        "Pictures\\family\\photo1.png",
+        "Desktop\\notes.txt",
+        "Videos\\birthday.mp4",
+        "Documents\\recipes\\cookies.pdf",
+        "Pictures\\screenshots\\screen1.png",
+        "Documents\\taxes\\2024.pdf",
+    ]
+    TEST_TOTAL_FILES = 1247
+    TEST_TOTAL_BYTES = 15_800_000_000  # ~15.8 GB simulated
+
+    def _start_test_backup(self):
+        """Begin the simulated test-mode backup."""
+        self._show_backing_up()
+        self._test_tick = 0
+        self._tick_test_backup()
+
+    def _tick_test_backup(self):
+        """Advance the simulated backup one step (1% per 50ms tick)."""
+        tick = self._test_tick
+
+        if tick > 100:
+            final_progress = BackupProgress(
+                total_files=self.TEST_TOTAL_FILES,
+                copied_files=self.TEST_TOTAL_FILES,
+                total_bytes=self.TEST_TOTAL_BYTES,
+                copied_bytes=self.TEST_TOTAL_BYTES,
+                current_file="Complete!",
                 errors=[]
-            ): self._update_progress(p))
-
-            time.sleep(0.05)  # 5 seconds total for simulation
-
-        # Complete
-        progress.copied_files = total_files
-        progress.copied_bytes = total_bytes
-        progress.current_file = "Complete!"
-
-        final_progress = BackupProgress(
-            total_files=total_files,
-            copied_files=total_files,
-            total_bytes=total_bytes,
-            copied_bytes=total_bytes,
-            current_file="Complete!",
-            errors=[]
-        )
-        self.root.after(0, lambda: self._on_backup_complete(final_progress))
+            )
+            self._on_backup_complete(final_progress)
+            return
+
+        copied_files = int((tick / 100) * self.TEST_TOTAL_FILES)
+        current_file = self.TEST_FILES[tick % len(self.TEST_FILES)]
+        self._update_progress((float(tick), copied_files,
+                               self.TEST_TOTAL_FILES, current_file))
+
+        self._test_tick = tick + 1
+        self.root.after(50, self._tick_test_backup)
+
+    def _update_progress(self, snapshot: tuple):
+        """Update the progress UI from a BackupProgress snapshot tuple."""
+        self._pending_update = False
 
-    def _update_progress(self, progress: BackupProgress):
-        """Update the progress UI."""
         if self.state != self.STATE_BACKING_UP:
             return
 
-        self.progress_bar['value'] = progress.percent
+        percent, copied_files, total_files, current = snapshot
 
-        if progress.total_files > 0:
-            self.progress_label.config(
-                text=f"{progress.copied_files:,} of {progress.total_files:,} files ({progress.percent:.0f}%)"
-            )
+        # The bar is only 350px wide; moving it for sub-percent changes
+        # just burns Tcl calls
+        pct_int = int(percent)
+        if pct_int != self._last_pct_int:
+            self._last_pct_int = pct_int
+            self.progress_bar['value'] = percent
+
+        if total_files > 0:
+            progress_text = f"{copied_files:,} of {total_files:,} files ({percent:.0f}%)"
         else:
-            self.progress_label.config(text="Counting files...")
+            progress_text = "Counting files..."
 
         # Truncate current file name if too long
-        current = progress.current_file
         if len(current) > 50:
             current = "..." + current[-47:]
-        self.current_file_label.config(text=current)
+
+        # Only touch the labels when the text actually changed; each
+        # .config call crosses into the Tcl interpreter
+        if progress_text != self._last_progress_text:
+            self._last_progress_text = progress_text
+            self.progress_label.config(text=progress_text)
+
+        if current != self._last_file_text:
+            self._last_file_text = current
+            self.current_file_label.config(text=current)
 
     def _on_backup_complete(self, progress: BackupProgress):
         """Handle backup completion."""
@@ -625,4 +757,7 @@ class BackupApp:
 
     def run(self):
         """Start the application."""
-        self.root.mainloop()
+        try:
+            self.root.mainloop()
+        finally:
+            self._bg.shutdown(wait=False)
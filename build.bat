@@ -1,6 +1,6 @@
 @echo off
 echo Installing dependencies...
-pip install psutil pyinstaller
+pip install -r requirements.txt pyinstaller
 
 echo.
 echo Building executable...
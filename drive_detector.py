@@ -1,36 +1,122 @@
 """Detects external/removable drives on Windows."""
 
-import psutil
-from pathlib import Path
+import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
 from typing import List, Optional
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 
+from settings import settings_present
 
-@dataclass
+if sys.platform == "win32":
+    import ctypes
+    from ctypes import wintypes
+
+    # Bind prototypes once at import so per-call argument marshaling
+    # stays cheap in the polling hot path
+    _kernel32 = ctypes.windll.kernel32
+    _kernel32.GetLogicalDrives.argtypes = []
+    _kernel32.GetLogicalDrives.restype = wintypes.DWORD
+    _kernel32.GetDriveTypeW.argtypes = [wintypes.LPCWSTR]
+    _kernel32.GetDriveTypeW.restype = wintypes.UINT
+    _kernel32.GetDiskFreeSpaceExW.argtypes = [
+        wintypes.LPCWSTR,
+        ctypes.POINTER(ctypes.c_ulonglong),
+        ctypes.POINTER(ctypes.c_ulonglong),
+        ctypes.POINTER(ctypes.c_ulonglong),
+    ]
+    _kernel32.GetDiskFreeSpaceExW.restype = wintypes.BOOL
+    _kernel32.GetVolumeInformationW.argtypes = [
+        wintypes.LPCWSTR,
+        wintypes.LPWSTR,
+        wintypes.DWORD,
+        ctypes.POINTER(wintypes.DWORD),
+        ctypes.POINTER(wintypes.DWORD),
+        ctypes.POINTER(wintypes.DWORD),
+        wintypes.LPWSTR,
+        wintypes.DWORD,
+    ]
+    _kernel32.GetVolumeInformationW.restype = wintypes.BOOL
+    _kernel32.CreateFileW.argtypes = [
+        wintypes.LPCWSTR, wintypes.DWORD, wintypes.DWORD,
+        ctypes.c_void_p, wintypes.DWORD, wintypes.DWORD, wintypes.HANDLE,
+    ]
+    _kernel32.CreateFileW.restype = wintypes.HANDLE
+    _kernel32.DeviceIoControl.argtypes = [
+        wintypes.HANDLE, wintypes.DWORD,
+        ctypes.c_void_p, wintypes.DWORD,
+        ctypes.c_void_p, wintypes.DWORD,
+        ctypes.POINTER(wintypes.DWORD), ctypes.c_void_p,
+    ]
+    _kernel32.DeviceIoControl.restype = wintypes.BOOL
+    _kernel32.CloseHandle.argtypes = [wintypes.HANDLE]
+    _kernel32.CloseHandle.restype = wintypes.BOOL
+    _kernel32.FindFirstVolumeW.argtypes = [wintypes.LPWSTR, wintypes.DWORD]
+    _kernel32.FindFirstVolumeW.restype = wintypes.HANDLE
+    _kernel32.FindNextVolumeW.argtypes = [
+        wintypes.HANDLE, wintypes.LPWSTR, wintypes.DWORD]
+    _kernel32.FindNextVolumeW.restype = wintypes.BOOL
+    _kernel32.FindVolumeClose.argtypes = [wintypes.HANDLE]
+    _kernel32.FindVolumeClose.restype = wintypes.BOOL
+    _kernel32.GetVolumePathNamesForVolumeNameW.argtypes = [
+        wintypes.LPCWSTR, wintypes.LPWSTR, wintypes.DWORD,
+        ctypes.POINTER(wintypes.DWORD)]
+    _kernel32.GetVolumePathNamesForVolumeNameW.restype = wintypes.BOOL
+
+    # Per-thread buffers reused across label lookups; volume labels cap
+    # at 32 chars and filesystem names are shorter still, so 256 is
+    # plenty. Thread-local rather than shared-and-locked so parallel
+    # drive scans don't serialize on a buffer lock
+    _volume_bufs = threading.local()
+
+    # GetDriveTypeW results we care about
+    DRIVE_REMOVABLE = 2
+    DRIVE_FIXED = 3
+
+    # Plumbing for the seek-penalty (rotational media) query
+    FILE_SHARE_READ = 0x00000001
+    FILE_SHARE_WRITE = 0x00000002
+    OPEN_EXISTING = 3
+    INVALID_HANDLE_VALUE = ctypes.c_void_p(-1).value
+    IOCTL_STORAGE_QUERY_PROPERTY = 0x002D1400
+    STORAGE_DEVICE_SEEK_PENALTY_PROPERTY = 7
+else:
+    _kernel32 = None
+
+
+@dataclass(slots=True, frozen=True)
 class DriveInfo:
     """Information about a detected drive."""
     letter: str  # e.g., "E:"
     label: str   # e.g., "My Backup Drive"
     total_gb: float
     free_gb: float
+    # True when the device reports a seek penalty (spinning HDD);
+    # backup code can prefer big sequential writes on those
+    is_rotational: bool = False
+    # 32-bit serial assigned at format time, read off the volume header
+    volume_serial: int = 0
+    # Derived strings, formatted once here instead of on every access
+    path: str = field(init=False)                # full path to the drive root
+    display_name: str = field(init=False)        # user-friendly name
+    unique_id: str = field(init=False)           # stable drive identifier
 
-    @property
-    def path(self) -> str:
-        """Get the full path to the drive root."""
-        return f"{self.letter}\\"
-
-    @property
-    def display_name(self) -> str:
-        """Get a user-friendly display name."""
+    def __post_init__(self):
+        # frozen=True blocks plain assignment, hence object.__setattr__
+        object.__setattr__(self, "path", f"{self.letter}\\")
         if self.label:
-            return f"{self.label} ({self.letter})"
-        return f"Drive ({self.letter})"
-
-    @property
-    def unique_id(self) -> str:
-        """Generate a unique identifier for this drive."""
-        # Use label + total size as a simple unique ID
-        return f"{self.label}_{int(self.total_gb * 1024)}"
+            display = f"{self.label} ({self.letter})"
+        else:
+            display = f"Drive ({self.letter})"
+        object.__setattr__(self, "display_name", display)
+        # The volume serial survives relabeling; fall back to the old
+        # label + size scheme when it couldn't be read
+        if self.volume_serial:
+            unique = f"{self.volume_serial:08X}"
+        else:
+            unique = f"{self.label}_{int(self.total_gb * 1024)}"
+        object.__setattr__(self, "unique_id", unique)
 
 
 class DriveDetector:
@@ -40,82 +126,348 @@ class DriveDetector:
     # On Windows: removable=True or fstype is common external formats
     EXTERNAL_FSTYPES = {'FAT32', 'exFAT', 'NTFS'}
 
+    # How long a scan result stays fresh; polls inside this window reuse
+    # the previous answer instead of re-running the OS queries
+    CACHE_TTL_SECS = 1.5
+
     def __init__(self):
         self._last_detected: List[DriveInfo] = []
+        self._cache_expires_at = 0.0
+        self._label_cache = {}  # drive letter -> (label, filesystem, serial)
+        self._seek_penalty_cache = {}  # drive letter -> is_rotational
+        self._pool: Optional[ThreadPoolExecutor] = None  # created on demand
+
+    def invalidate(self):
+        """Force the next query to rescan (e.g. after a device change)."""
+        self._cache_expires_at = 0.0
+        self._label_cache.clear()
+        self._seek_penalty_cache.clear()
+
+    def start_watching(self, hwnd: int, callback) -> bool:
+        """
+        Subscribe to WM_DEVICECHANGE volume notifications on the given
+        window handle. `callback` runs (on the window's message thread)
+        whenever a drive arrives or is removed, after the scan cache has
+        been invalidated, so detection becomes event-driven instead of
+        pure polling.
+
+        Returns True when the subscription is active; on False the
+        caller should rely on polling alone.
+        """
+        if sys.platform != "win32":
+            return False
+
+        import ctypes
+        import uuid
+        from ctypes import wintypes
+
+        WM_DEVICECHANGE = 0x0219
+        DBT_DEVICEARRIVAL = 0x8000
+        DBT_DEVICEREMOVECOMPLETE = 0x8004
+        DBT_DEVTYP_DEVICEINTERFACE = 5
+        GWLP_WNDPROC = -4
+        GUID_DEVINTERFACE_VOLUME = uuid.UUID("53f5630d-b6bf-11d0-94f2-00a0c91efb8b")
+
+        class DEV_BROADCAST_DEVICEINTERFACE(ctypes.Structure):
+            _fields_ = [
+                ("dbcc_size", wintypes.DWORD),
+                ("dbcc_devicetype", wintypes.DWORD),
+                ("dbcc_reserved", wintypes.DWORD),
+                ("dbcc_classguid", ctypes.c_byte * 16),
+                ("dbcc_name", ctypes.c_wchar * 1),
+            ]
+
+        try:
+            user32 = ctypes.windll.user32
+
+            WNDPROC = ctypes.WINFUNCTYPE(ctypes.c_ssize_t, wintypes.HWND,
+                                         ctypes.c_uint, wintypes.WPARAM,
+                                         wintypes.LPARAM)
+            call_window_proc = user32.CallWindowProcW
+            call_window_proc.argtypes = [ctypes.c_void_p, wintypes.HWND,
+                                         ctypes.c_uint, wintypes.WPARAM,
+                                         wintypes.LPARAM]
+            call_window_proc.restype = ctypes.c_ssize_t
+            user32.SetWindowLongPtrW.argtypes = [wintypes.HWND, ctypes.c_int, WNDPROC]
+            user32.SetWindowLongPtrW.restype = ctypes.c_void_p
+
+            def wnd_proc(h, msg, wparam, lparam):
+                if (msg == WM_DEVICECHANGE
+                        and wparam in (DBT_DEVICEARRIVAL, DBT_DEVICEREMOVECOMPLETE)):
+                    self.invalidate()
+                    callback()
+                return call_window_proc(self._old_wnd_proc, h, msg, wparam, lparam)
+
+            # Keep a reference so the callback isn't garbage collected
+            self._wnd_proc = WNDPROC(wnd_proc)
+            self._old_wnd_proc = user32.SetWindowLongPtrW(hwnd, GWLP_WNDPROC,
+                                                          self._wnd_proc)
+
+            notification_filter = DEV_BROADCAST_DEVICEINTERFACE()
+            notification_filter.dbcc_size = ctypes.sizeof(notification_filter)
+            notification_filter.dbcc_devicetype = DBT_DEVTYP_DEVICEINTERFACE
+            notification_filter.dbcc_classguid = (ctypes.c_byte * 16).from_buffer_copy(
+                GUID_DEVINTERFACE_VOLUME.bytes_le)
+            user32.RegisterDeviceNotificationW(hwnd,
+                                               ctypes.byref(notification_filter), 0)
+            return True
+        except (AttributeError, OSError, ValueError):
+            return False
 
     def get_external_drives(self) -> List[DriveInfo]:
         """Get a list of all currently connected removable drives."""
+        # Serve from cache while fresh; drives don't come and go within
+        # a poll tick, and each real scan costs several syscalls
+        now = time.monotonic()
+        if now < self._cache_expires_at:
+            return self._last_detected
+
         drives = []
+        letters = list(self._iter_volume_mount_roots())
 
-        for partition in psutil.disk_partitions(all=False):
-            # Skip system drives (usually C:)
-            if partition.mountpoint == "C:\\":
-                continue
+        if len(letters) == 1:
+            # No point waking the pool for a single drive
+            drive_info = self._build_drive_info(letters[0])
+            if drive_info is not None:
+                drives.append(drive_info)
+        elif letters:
+            # A spun-down USB HDD can take tens of ms per metadata
+            # query, so run the candidates together: the scan costs
+            # max(per-drive latency) instead of the sum. The syscalls
+            # release the GIL, so the threads genuinely overlap
+            futures = [self._get_pool().submit(self._build_drive_info, letter)
+                       for letter in letters]
+            for future in futures:
+                try:
+                    drive_info = future.result()
+                except Exception:
+                    continue
+                if drive_info is not None:
+                    drives.append(drive_info)
 
-            try:
-                usage = psutil.disk_usage(partition.mountpoint)
+        self._last_detected = drives
+        self._cache_expires_at = now + self.CACHE_TTL_SECS
+        return drives
 
-                # Get drive label from the path
-                drive_letter = partition.mountpoint.rstrip("\\")
-                label = self._get_drive_label(drive_letter)
+    def _get_pool(self) -> ThreadPoolExecutor:
+        """Shared worker pool for per-drive metadata, created lazily."""
+        if self._pool is None:
+            self._pool = ThreadPoolExecutor(max_workers=4,
+                                            thread_name_prefix="drivescan")
+        return self._pool
 
-                # Check if this drive should be included:
-                # 1. Has 'removable' flag (USB flash drives, SD cards)
-                # 2. Hardcoded: Drive labeled "MomSSD"
-                # 3. Not C: and has a valid external filesystem type (catches external SSDs)
-                is_removable = 'removable' in partition.opts.lower()
-                is_momssd = label.upper() == "MOMSSD"
-                is_external_fs = partition.fstype in self.EXTERNAL_FSTYPES
+    def _iter_volume_mount_roots(self):
+        """
+        Yield candidate drive letters by walking the volume manager's
+        list in one FindFirstVolumeW/FindNextVolumeW pass. Unlike the
+        per-letter mask walk this never probes unmounted letters, and
+        the whole batch is two calls per actual volume. Falls back to
+        the mask walk when enumeration isn't available.
+        """
+        if _kernel32 is None:
+            return
 
-                if not (is_removable or is_momssd or is_external_fs):
-                    continue
+        # \\?\Volume{GUID}\ names are 49 chars
+        name_buf = ctypes.create_unicode_buffer(64)
+        handle = _kernel32.FindFirstVolumeW(name_buf, len(name_buf))
+        if handle in (None, INVALID_HANDLE_VALUE):
+            yield from self._iter_removable_roots()
+            return
 
-                drive_info = DriveInfo(
-                    letter=drive_letter,
-                    label=label,
-                    total_gb=usage.total / (1024 ** 3),
-                    free_gb=usage.free / (1024 ** 3)
-                )
-                drives.append(drive_info)
+        try:
+            paths_buf = ctypes.create_unicode_buffer(512)
+            returned = wintypes.DWORD()
+            while True:
+                if _kernel32.GetVolumePathNamesForVolumeNameW(
+                        name_buf.value, paths_buf, len(paths_buf),
+                        ctypes.byref(returned)):
+                    # The buffer holds NUL-separated mount roots; only
+                    # drive-letter roots like "E:\" interest us
+                    for root in paths_buf[:returned.value].split('\x00'):
+                        if len(root) != 3 or root[1:] != ':\\':
+                            continue
+                        drive_letter = root[:2]
+                        if drive_letter == "C:":
+                            break
+                        if _kernel32.GetDriveTypeW(root) in (DRIVE_REMOVABLE,
+                                                             DRIVE_FIXED):
+                            yield drive_letter
+                        break  # one letter per volume is enough
+
+                if not _kernel32.FindNextVolumeW(handle, name_buf,
+                                                 len(name_buf)):
+                    break
+        finally:
+            _kernel32.FindVolumeClose(handle)
+
+    def _iter_removable_roots(self):
+        """
+        Yield candidate drive letters (e.g. "E:") without querying the
+        volume itself — just the mount mask plus a drive-type check per
+        letter, so callers that only need a path stay cheap.
+        """
+        if _kernel32 is None:
+            return
+
+        # One syscall gives every mounted letter as a 26-bit mask
+        drive_mask = _kernel32.GetLogicalDrives()
 
-            except (PermissionError, OSError):
-                # Skip drives we can't access
+        for i in range(26):
+            if not (drive_mask >> i) & 1:
                 continue
 
-        self._last_detected = drives
-        return drives
+            drive_letter = f"{chr(65 + i)}:"
+
+            # Skip system drives (usually C:)
+            if drive_letter == "C:":
+                continue
+
+            # Only removable sticks/cards and fixed disks are candidates
+            # (external SSDs report as fixed); drops CD-ROM, network and
+            # RAM drives without touching the device
+            drive_type = _kernel32.GetDriveTypeW(drive_letter + "\\")
+            if drive_type in (DRIVE_REMOVABLE, DRIVE_FIXED):
+                yield drive_letter
+
+    def _build_drive_info(self, drive_letter: str) -> Optional[DriveInfo]:
+        """
+        Build a DriveInfo for one candidate letter, or None if it is not
+        an external drive or cannot be read. This is where the volume
+        info and free-space syscalls happen.
+        """
+        root = drive_letter + "\\"
 
-    def _get_drive_label(self, drive_letter: str) -> str:
-        """Get the volume label for a drive."""
         try:
-            import ctypes
-            kernel32 = ctypes.windll.kernel32
-            volume_name_buffer = ctypes.create_unicode_buffer(1024)
-
-            # GetVolumeInformationW to get volume label
-            result = kernel32.GetVolumeInformationW(
-                f"{drive_letter}\\",
-                volume_name_buffer,
-                ctypes.sizeof(volume_name_buffer),
-                None, None, None, None, 0
+            label, fstype, serial = self._get_volume_info(drive_letter)
+
+            # Check if this drive should be included:
+            # 1. Removable drive type (USB flash drives, SD cards)
+            # 2. Hardcoded: Drive labeled "MomSSD"
+            # 3. Not C: and has a valid external filesystem type (catches external SSDs)
+            is_removable = _kernel32.GetDriveTypeW(root) == DRIVE_REMOVABLE
+            is_momssd = label.upper() == "MOMSSD"
+            is_external_fs = fstype in self.EXTERNAL_FSTYPES
+
+            if not (is_removable or is_momssd or is_external_fs):
+                return None
+
+            total = ctypes.c_ulonglong()
+            free = ctypes.c_ulonglong()
+            if not _kernel32.GetDiskFreeSpaceExW(
+                    root, None, ctypes.byref(total), ctypes.byref(free)):
+                return None
+
+            return DriveInfo(
+                letter=drive_letter,
+                label=label,
+                total_gb=total.value / (1024 ** 3),
+                free_gb=free.value / (1024 ** 3),
+                is_rotational=self._is_rotational(drive_letter),
+                volume_serial=serial
             )
 
-            if result:
-                return volume_name_buffer.value
+        except (PermissionError, OSError):
+            # Skip drives we can't access
+            return None
+
+    def _get_volume_info(self, drive_letter: str) -> tuple:
+        """Get (label, filesystem, serial) for a drive (memoized per letter)."""
+        if drive_letter in self._label_cache:
+            return self._label_cache[drive_letter]
+
+        info = self._read_volume_info(drive_letter)
+        self._label_cache[drive_letter] = info
+        return info
+
+    def _read_volume_info(self, drive_letter: str) -> tuple:
+        """Read the volume label, filesystem name and serial from the OS."""
+        try:
+            try:
+                label_buf = _volume_bufs.label
+                fs_buf = _volume_bufs.fs
+            except AttributeError:
+                label_buf = _volume_bufs.label = ctypes.create_unicode_buffer(256)
+                fs_buf = _volume_bufs.fs = ctypes.create_unicode_buffer(256)
+
+            serial = wintypes.DWORD()
+            if _kernel32.GetVolumeInformationW(
+                    drive_letter + "\\",
+                    label_buf, len(label_buf),
+                    ctypes.byref(serial), None, None,
+                    fs_buf, len(fs_buf)):
+                return label_buf.value, fs_buf.value, serial.value
         except Exception:
             pass
 
-        return ""
+        return "", "", 0
+
+    def _is_rotational(self, drive_letter: str) -> bool:
+        """
+        Ask the storage stack whether the device behind a letter incurs
+        a seek penalty, i.e. is a rotating HDD (memoized per letter,
+        cleared on device change). Defaults to False when the query
+        fails — flash media is the common case here.
+        """
+        if drive_letter in self._seek_penalty_cache:
+            return self._seek_penalty_cache[drive_letter]
+
+        result = False
+        try:
+
+            class STORAGE_PROPERTY_QUERY(ctypes.Structure):
+                _fields_ = [
+                    ("PropertyId", wintypes.DWORD),
+                    ("QueryType", wintypes.DWORD),
+                    ("AdditionalParameters", ctypes.c_byte * 1),
+                ]
+
+            class DEVICE_SEEK_PENALTY_DESCRIPTOR(ctypes.Structure):
+                _fields_ = [
+                    ("Version", wintypes.DWORD),
+                    ("Size", wintypes.DWORD),
+                    ("IncursSeekPenalty", wintypes.BOOLEAN),
+                ]
+
+            # Zero desired access is enough for property queries and
+            # doesn't require admin rights
+            handle = _kernel32.CreateFileW(
+                "\\\\.\\" + drive_letter, 0,
+                FILE_SHARE_READ | FILE_SHARE_WRITE,
+                None, OPEN_EXISTING, 0, None)
+            if handle not in (None, INVALID_HANDLE_VALUE):
+                try:
+                    query = STORAGE_PROPERTY_QUERY()
+                    query.PropertyId = STORAGE_DEVICE_SEEK_PENALTY_PROPERTY
+                    query.QueryType = 0  # PropertyStandardQuery
+                    descriptor = DEVICE_SEEK_PENALTY_DESCRIPTOR()
+                    returned = wintypes.DWORD()
+                    if _kernel32.DeviceIoControl(
+                            handle, IOCTL_STORAGE_QUERY_PROPERTY,
+                            ctypes.byref(query), ctypes.sizeof(query),
+                            ctypes.byref(descriptor), ctypes.sizeof(descriptor),
+                            ctypes.byref(returned), None):
+                        result = bool(descriptor.IncursSeekPenalty)
+                finally:
+                    _kernel32.CloseHandle(handle)
+        except Exception:
+            pass
+
+        self._seek_penalty_cache[drive_letter] = result
+        return result
 
     def find_drive_with_settings(self, settings_filename: str) -> Optional[DriveInfo]:
         """Find a drive that has our settings file on it."""
-        for drive in self.get_external_drives():
-            settings_path = Path(drive.path) / settings_filename
-            if settings_path.exists():
-                return drive
+        # Misses cost at most one (memoized) stat each; only the hit
+        # pays for the volume info and free-space queries
+        for drive_letter in self._iter_removable_roots():
+            if settings_present(drive_letter + "\\" + settings_filename):
+                return self._build_drive_info(drive_letter)
         return None
 
     def get_first_drive(self) -> Optional[DriveInfo]:
         """Get the first available external drive, or None."""
-        drives = self.get_external_drives()
-        return drives[0] if drives else None
+        for drive_letter in self._iter_removable_roots():
+            drive_info = self._build_drive_info(drive_letter)
+            if drive_info is not None:
+                return drive_info
+        return None
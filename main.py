@@ -3,13 +3,21 @@ Mom's Backup Tool
 A simple backup application for backing up files to an external drive.
 """
 
-import sys
-from backup_app import BackupApp
-
 
 def main():
-    test_mode = "--test" in sys.argv
-    app = BackupApp(test_mode=test_mode)
+    import argparse
+
+    parser = argparse.ArgumentParser(
+        description="A simple backup application for backing up files "
+                    "to an external drive.")
+    parser.add_argument("--test", action="store_true",
+                        help="run with a simulated drive and fake backup")
+    args = parser.parse_args()
+
+    # Deferred so --help/--version never pay for the tkinter import
+    from backup_app import BackupApp
+
+    app = BackupApp(test_mode=args.test)
     app.run()
 
 
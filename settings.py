@@ -1,49 +1,290 @@
 """Settings file management for the backup tool."""
 
+import copy
 import json
+import os
+import time
+from functools import lru_cache
 from pathlib import Path
 from datetime import datetime
 from typing import Optional
 
-SETTINGS_FILENAME = ".mom_backup_settings.json"
+SETTINGS_FILENAME = ".mom_backup_settings.msgpack"
+
+# Drives initialized before the msgpack switch still carry this file;
+# load() imports it once and rewrites it in the new format
+LEGACY_SETTINGS_FILENAME = ".mom_backup_settings.json"
+
+# msgpack packs the payload to compact binary in one C call — no text
+# parsing or whitespace on the slow USB side. Timestamps stay as ISO
+# strings inside the payload; the app does naive-datetime arithmetic
+# on them, which msgpack's timezone-aware timestamp type would break.
+import msgpack
+
+
+def _dumps(data) -> bytes:
+    return msgpack.packb(data, use_bin_type=True)
+
+
+def _loads(raw):
+    return msgpack.unpackb(raw, raw=False)
+
+
+# Optional: compress the payload before it hits slow USB media, where
+# write bandwidth is the bottleneck once backup history starts growing
+# the file. Purely opportunistic — absence of the package just means
+# plain msgpack on disk.
+try:
+    import zstandard as _zstd
+except ImportError:
+    _zstd = None
+
+# Standard zstd frame magic, used to sniff compressed files on load
+_ZSTD_MAGIC = b'\x28\xb5\x2f\xfd'
+
+# Below this the frame overhead outweighs any savings
+_COMPRESS_THRESHOLD = 1024
+
+
+def _maybe_decompress(raw: bytes) -> bytes:
+    """Undo zstd framing if present; raises ValueError when it can't."""
+    if raw.startswith(_ZSTD_MAGIC):
+        if _zstd is None:
+            raise ValueError("settings file is compressed but zstandard "
+                             "is not installed")
+        try:
+            raw = _zstd.ZstdDecompressor().decompress(raw)
+        except _zstd.ZstdError as exc:
+            raise ValueError(str(exc)) from exc
+    return raw
+
+# Parsed settings shared across Settings instances, keyed by file path.
+# The (mtime_ns, size) pair detects on-disk changes so a stale entry is
+# never served, and deepcopy keeps each instance's edits private. Saves
+# a read from slow flash media every time the GUI rebuilds a Settings.
+_SETTINGS_CACHE = {}  # Path -> (mtime_ns, size, parsed dict)
+
+
+@lru_cache(maxsize=64)
+def _settings_present(path_str: str, _bucket: int) -> bool:
+    """Memoized stat, at most one per path per second (see below)."""
+    return os.path.exists(path_str)
+
+
+def settings_present(path) -> bool:
+    """
+    Check whether a settings file exists, remembering the answer for up
+    to a second. The GUI and the drive scanner fire these checks in
+    bursts, and each miss is a stat against slow removable media.
+    """
+    return _settings_present(str(path), int(time.monotonic()))
+
+
+@lru_cache(maxsize=1)
+def _iso_at(bucket: int) -> str:
+    """
+    ISO timestamp for a whole epoch second. Backups recorded within the
+    same second share one formatted string, which also lets the
+    skip-unchanged save path kick in for rapid repeat clicks.
+    """
+    return datetime.fromtimestamp(bucket).isoformat()
+
+
+@lru_cache(maxsize=1)
+def _today(_bucket: int):
+    """
+    Today's date, keyed by the wall-clock second so UI refreshes within
+    the same second share one result while midnight still rolls over
+    promptly.
+    """
+    return datetime.now().date()
 
 
 class Settings:
     """Manages the settings file stored on the backup drive."""
 
+    __slots__ = ('drive_path', 'settings_file', '_data_cache',
+                 '_dirty_keys', '_last_backup_dt', '_last_saved_bytes')
+
+    _DEFAULTS = {
+        "drive_id": "",
+        "last_backup": None,
+        "backup_count": 0
+    }
+
     def __init__(self, drive_path: str):
         self.drive_path = Path(drive_path)
         self.settings_file = self.drive_path / SETTINGS_FILENAME
-        self._data = {
-            "drive_id": "",
-            "last_backup": None,
-            "backup_count": 0
-        }
+        # Filled on first _data access; None means "not read yet", so
+        # constructing a Settings costs nothing on the USB side
+        self._data_cache: Optional[dict] = None
+        # Keys this instance has modified; save() overlays just these
+        # onto whatever is currently on disk
+        self._dirty_keys: set = set()
+        # Parsed form of _data["last_backup"], refreshed whenever that
+        # field changes so accessors never re-run fromisoformat
+        self._last_backup_dt: Optional[datetime] = None
+        # Bytes of the last successful save/load, used to skip writes
+        # that wouldn't change the file
+        self._last_saved_bytes: Optional[bytes] = None
+
+    @property
+    def _data(self) -> dict:
+        """Settings dict, read from the drive on first access."""
+        if self._data_cache is None:
+            if not self.load():
+                self._data_cache = dict(self._DEFAULTS)
+        return self._data_cache
+
+    @_data.setter
+    def _data(self, value: dict):
+        self._data_cache = value
 
     def exists(self) -> bool:
         """Check if settings file exists on the drive."""
-        return self.settings_file.exists()
+        return (settings_present(self.settings_file)
+                or settings_present(self.drive_path / LEGACY_SETTINGS_FILENAME))
+
+    @staticmethod
+    def invalidate_exists():
+        """Drop memoized existence checks (e.g. after creating a file)."""
+        _settings_present.cache_clear()
 
     def load(self) -> bool:
         """Load settings from the drive. Returns True if successful."""
         try:
-            if self.settings_file.exists():
-                with open(self.settings_file, 'r', encoding='utf-8') as f:
-                    self._data = json.load(f)
-                return True
-        except (json.JSONDecodeError, IOError):
+            st = self.settings_file.stat()
+        except OSError:
+            return self._load_legacy_json()
+
+        key = (st.st_mtime_ns, st.st_size)
+        cached = _SETTINGS_CACHE.get(self.settings_file)
+        if cached is not None and cached[:2] == key:
+            self._data = copy.deepcopy(cached[2])
+            self._last_backup_dt = self._parse_last_backup()
+            return True
+
+        try:
+            raw = self.settings_file.read_bytes()
+        except OSError:
+            return False
+
+        # A zero-byte file (interrupted save from an old version) gets
+        # the same fall-through as unparseable content
+        if not raw:
+            return False
+
+        try:
+            raw = _maybe_decompress(raw)
+            self._data = _loads(raw)
+        except ValueError:
+            return False
+
+        self._last_backup_dt = self._parse_last_backup()
+        self._last_saved_bytes = raw
+        _SETTINGS_CACHE[self.settings_file] = key + (copy.deepcopy(self._data),)
+        return True
+
+    def _parse_last_backup(self) -> Optional[datetime]:
+        """Parse the stored ISO timestamp, or None if absent/invalid."""
+        last = self._data.get("last_backup")
+        if last:
+            try:
+                return datetime.fromisoformat(last)
+            except ValueError:
+                pass
+        return None
+
+    def _load_legacy_json(self) -> bool:
+        """Import a pre-msgpack JSON settings file and convert it."""
+        legacy_file = self.drive_path / LEGACY_SETTINGS_FILENAME
+        try:
+            raw = legacy_file.read_bytes()
+            if not raw:
+                return False
+            self._data = json.loads(raw)
+        except (ValueError, OSError):
+            return False
+
+        self._last_backup_dt = self._parse_last_backup()
+
+        # Rewrite in the new format; only drop the old file once the
+        # replacement is safely on disk
+        if self.save():
+            try:
+                legacy_file.unlink()
+            except OSError:
+                pass
+        return True
+
+    def _read_disk_state(self) -> Optional[dict]:
+        """Best-effort parse of the file's current contents."""
+        try:
+            st = self.settings_file.stat()
+            cached = _SETTINGS_CACHE.get(self.settings_file)
+            if cached is not None and cached[:2] == (st.st_mtime_ns, st.st_size):
+                return copy.deepcopy(cached[2])
+            raw = self.settings_file.read_bytes()
+            if raw:
+                return _loads(_maybe_decompress(raw))
+        except (ValueError, OSError):
             pass
-        return False
+        return None
 
     def save(self) -> bool:
         """Save settings to the drive. Returns True if successful."""
-        try:
-            with open(self.settings_file, 'w', encoding='utf-8') as f:
-                json.dump(self._data, f, indent=2)
+        data = self._data
+
+        # Overlay only the keys this instance touched onto whatever is
+        # on disk now, so two live Settings objects can't clobber each
+        # other's untouched fields
+        if self._dirty_keys:
+            on_disk = self._read_disk_state()
+            if on_disk is not None:
+                on_disk.update((key, data[key]) for key in self._dirty_keys)
+                data = self._data_cache = on_disk
+
+        payload = _dumps(data)
+
+        # An identical payload would only burn a flash write cycle;
+        # the file on disk is already exactly this
+        if payload == self._last_saved_bytes:
+            self._dirty_keys.clear()
             return True
-        except IOError:
+
+        # Once the payload is big enough to matter on USB bandwidth,
+        # spend a little CPU (level 1 is nearly free) to shrink it
+        blob = payload
+        if _zstd is not None and len(payload) >= _COMPRESS_THRESHOLD:
+            blob = _zstd.ZstdCompressor(level=1).compress(payload)
+
+        # Write the whole payload to a sibling temp file, then swap it
+        # in with os.replace: one write syscall, and pulling the drive
+        # mid-save can no longer leave a half-written settings file
+        try:
+            tmp = self.settings_file.with_name(self.settings_file.name + '.tmp')
+            tmp.write_bytes(blob)
+            os.replace(tmp, self.settings_file)
+        except OSError:
             return False
 
+        self._last_saved_bytes = payload
+        self._dirty_keys.clear()
+
+        # The file may have just come into existence; don't let a
+        # memoized "missing" answer outlive it
+        _settings_present.cache_clear()
+
+        # What we just wrote is by definition what's on disk, so the
+        # cache can serve the next load without touching the drive
+        try:
+            st = self.settings_file.stat()
+            _SETTINGS_CACHE[self.settings_file] = (
+                st.st_mtime_ns, st.st_size, copy.deepcopy(self._data))
+        except OSError:
+            _SETTINGS_CACHE.pop(self.settings_file, None)
+        return True
+
     def initialize(self, drive_id: str) -> bool:
         """Initialize settings for a new backup drive."""
         self._data = {
@@ -51,29 +292,29 @@ class Settings:
             "last_backup": None,
             "backup_count": 0
         }
+        self._dirty_keys = set(self._data)
+        self._last_backup_dt = None
         return self.save()
 
     def record_backup(self) -> bool:
         """Record that a backup was completed now."""
-        self._data["last_backup"] = datetime.now().isoformat()
+        bucket = int(time.time())
+        self._data["last_backup"] = _iso_at(bucket)
         self._data["backup_count"] = self._data.get("backup_count", 0) + 1
+        self._dirty_keys.update(("last_backup", "backup_count"))
+        self._last_backup_dt = datetime.fromtimestamp(bucket)
         return self.save()
 
     def get_last_backup(self) -> Optional[datetime]:
         """Get the datetime of the last backup, or None if never backed up."""
-        last = self._data.get("last_backup")
-        if last:
-            try:
-                return datetime.fromisoformat(last)
-            except ValueError:
-                pass
-        return None
+        self._data  # materialize disk state on first touch
+        return self._last_backup_dt
 
     def was_backed_up_today(self) -> bool:
         """Check if a backup was completed today."""
         last = self.get_last_backup()
         if last:
-            return last.date() == datetime.now().date()
+            return last.date() == _today(int(time.time()))
         return False
 
     def get_backup_count(self) -> int: